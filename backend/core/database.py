@@ -1,6 +1,7 @@
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from sqlalchemy.exc import OperationalError, IntegrityError, ProgrammingError
 from .config import settings
 from enum import Enum
@@ -38,6 +39,17 @@ POOL_SETTINGS = {
     "pool_use_lifo": True,
 }
 
+# psycopg2 executemany tuning for bulk writes from migrations/seeders only:
+# UPDATE/DELETE and textual executemany calls are pipelined with
+# execute_batch (Core INSERTs already use SQLAlchemy's multi-row
+# insertmanyvalues, 1000 rows per statement by default). Never used on the
+# application engines below: execute_batch does not report a reliable
+# rowcount, which ORM stale-row detection relies on.
+BULK_EXECUTEMANY_SETTINGS = {
+    "executemany_mode": "values_plus_batch",
+    "executemany_batch_page_size": 500,
+}
+
 # Create engines for each database
 engines = {
     DatabaseType.CLIENTS: create_engine(settings.DATABASE_URL_CLIENTS, **POOL_SETTINGS),
@@ -60,6 +72,15 @@ SessionLocalSettings = sessionmaker(autocommit=False, autoflush=False, bind=engi
 SessionLocalUnits = sessionmaker(autocommit=False, autoflush=False, bind=engines[DatabaseType.UNITS])
 SessionLocalSizeColor = sessionmaker(autocommit=False, autoflush=False, bind=engines[DatabaseType.SIZECOLOR])
 
+# Separate engine for the bulk color import, so its executemany tuning never
+# reaches request sessions; it opens no connections until the import runs
+bulk_engines = {
+    DatabaseType.SIZECOLOR: create_engine(
+        settings.DATABASE_URL_SIZECOLOR, pool_pre_ping=True, poolclass=NullPool, **BULK_EXECUTEMANY_SETTINGS
+    ),
+}
+SessionLocalSizeColorBulk = sessionmaker(autocommit=False, autoflush=False, bind=bulk_engines[DatabaseType.SIZECOLOR])
+
 # Create separate Base classes for each database
 BaseClients = declarative_base()
 BaseSamples = declarative_base()
@@ -10,12 +10,18 @@ Runs automatically on docker-compose up
 """
 
 import pandas as pd
+import hashlib
+import json
 import os
+from pathlib import Path
 from sqlalchemy.orm import Session
-from sqlalchemy import text
-from core.database import SessionLocalSizeColor
+from sqlalchemy import column, func, literal_column, table, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from core.database import SessionLocalSizeColorBulk
+from migrations.seed_helpers import copy_universal_colors, get_migration_state, set_migration_state
 import logging
-from typing import List, Dict, Optional
+from itertools import islice
+from typing import Iterable, List, Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -35,120 +41,134 @@ def clean_string_value(value) -> Optional[str]:
     return cleaned
 
 
-def batch_insert_hm_colors(db: Session, colors_data: List[Dict], batch_size: int = 500):
-    """Batch insert H&M colors for better performance"""
+# H&M color statements are compiled once and reused for every row
+HM_COLOR_CODES_SQL = text("""
+    SELECT color_code FROM hm_colors
+""")
+
+HM_COLOR_UPDATE_SQL = text("""
+    UPDATE hm_colors
+    SET color_master = :color_master,
+        color_value = :color_value,
+        mixed_name = :mixed_name,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE color_code = :color_code
+""")
+
+HM_COLOR_INSERT_SQL = text("""
+    INSERT INTO hm_colors (color_code, color_master, color_value, mixed_name, is_active)
+    VALUES (:color_code, :color_master, :color_value, :mixed_name, :is_active)
+""")
+
+
+def batch_insert_hm_colors(db: Session, colors_data: Iterable[Dict], batch_size: int = 1000):
+    """Batch insert H&M colors for better performance (colors_data may be a generator)"""
     total_inserted = 0
     total_updated = 0
+    rows_seen = 0
+    batch_number = 0
 
-    for i in range(0, len(colors_data), batch_size):
-        batch = colors_data[i:i + batch_size]
-        batch_inserted = 0
-        batch_updated = 0
+    # Load every existing code once instead of one lookup per row
+    existing_codes = set(db.execute(HM_COLOR_CODES_SQL).scalars())
+
+    # Pull one batch at a time so only batch_size rows are held here
+    rows = iter(colors_data)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            break
+        batch_number += 1
+        rows_seen += len(batch)
 
         try:
+            # Split the batch; a code repeated in the data updates the row inserted before it
+            to_insert = []
+            to_update = []
             for color_data in batch:
-                # Check if color exists
-                existing = db.execute(text("""
-                    SELECT id FROM hm_colors WHERE color_code = :color_code
-                """), {"color_code": color_data['color_code']}).fetchone()
-
-                if existing:
-                    # Update existing
-                    db.execute(text("""
-                        UPDATE hm_colors
-                        SET color_master = :color_master,
-                            color_value = :color_value,
-                            mixed_name = :mixed_name,
-                            updated_at = CURRENT_TIMESTAMP
-                        WHERE color_code = :color_code
-                    """), color_data)
-                    batch_updated += 1
+                if color_data['color_code'] in existing_codes:
+                    to_update.append(color_data)
                 else:
-                    # Insert new
-                    db.execute(text("""
-                        INSERT INTO hm_colors (color_code, color_master, color_value, mixed_name, is_active)
-                        VALUES (:color_code, :color_master, :color_value, :mixed_name, :is_active)
-                    """), color_data)
-                    batch_inserted += 1
-
-            # Commit batch
-            db.commit()
+                    to_insert.append(color_data)
+                    existing_codes.add(color_data['color_code'])
+
+            if to_insert:
+                db.execute(HM_COLOR_INSERT_SQL, to_insert)
+            if to_update:
+                db.execute(HM_COLOR_UPDATE_SQL, to_update)
+            batch_inserted = len(to_insert)
+            batch_updated = len(to_update)
+
             total_inserted += batch_inserted
             total_updated += batch_updated
 
-            if (i + batch_size) % 1000 == 0 or (i + batch_size) >= len(colors_data):
-                logger.info(f"H&M Colors Progress: {min(i + batch_size, len(colors_data))}/{len(colors_data)}")
+            logger.info("H&M Colors batch %d: +%d ~%d (%d rows so far)",
+                        batch_number, batch_inserted, batch_updated, rows_seen)
 
         except Exception as e:
-            db.rollback()
-            logger.error(f"Error in H&M colors batch {i//batch_size + 1}: {e}")
+            # The caller owns the transaction and rolls the whole import back
+            logger.error(f"Error in H&M colors batch {batch_number}: {e}")
             raise
 
     return total_inserted, total_updated
 
 
+def build_universal_colors_upsert(fields: List[str]):
+    """Build a reusable INSERT ... ON CONFLICT (color_code) DO UPDATE for universal_colors"""
+    universal_colors = table("universal_colors", *(column(field) for field in fields), column("updated_at"))
+
+    stmt = pg_insert(universal_colors)
+    # Keep existing values where the incoming value is NULL (matches the old per-row UPDATE)
+    update_set = {
+        field: func.coalesce(stmt.excluded[field], universal_colors.c[field])
+        for field in fields if field != 'color_code'
+    }
+    update_set['updated_at'] = func.current_timestamp()
+
+    return stmt.on_conflict_do_update(
+        index_elements=['color_code'],
+        set_=update_set
+    ).returning(literal_column("(xmax = 0)").label("inserted"))
+
+
 def batch_insert_universal_colors(db: Session, colors_data: List[Dict], batch_size: int = 500):
-    """Batch insert universal colors for better performance"""
+    """Batch upsert universal colors - one cached INSERT ... ON CONFLICT statement for all batches"""
     total_inserted = 0
     total_updated = 0
 
+    if not colors_data:
+        return total_inserted, total_updated
+
+    total_batches = (len(colors_data) + batch_size - 1) // batch_size
+
+    # Statement is built once and re-executed with each batch's parameter list
+    upsert_stmt = build_universal_colors_upsert(list(colors_data[0].keys()))
+
     for i in range(0, len(colors_data), batch_size):
         batch = colors_data[i:i + batch_size]
-        batch_inserted = 0
-        batch_updated = 0
 
         try:
-            for color_data in batch:
-                # Check if color exists by color_code
-                existing = db.execute(text("""
-                    SELECT id FROM universal_colors WHERE color_code = :color_code
-                """), {"color_code": color_data['color_code']}).fetchone()
-
-                if existing:
-                    # Update existing
-                    update_fields = []
-                    update_params = {"id": existing[0]}
-
-                    for field, value in color_data.items():
-                        if field != 'color_code' and value is not None:
-                            update_fields.append(f"{field} = :{field}")
-                            update_params[field] = value
-
-                    if update_fields:
-                        update_fields.append("updated_at = CURRENT_TIMESTAMP")
-                        update_query = f"UPDATE universal_colors SET {', '.join(update_fields)} WHERE id = :id"
-                        db.execute(text(update_query), update_params)
-                        batch_updated += 1
-                else:
-                    # Insert new
-                    fields = list(color_data.keys())
-                    placeholders = [f":{field}" for field in fields]
-
-                    insert_query = f"""
-                        INSERT INTO universal_colors ({', '.join(fields)})
-                        VALUES ({', '.join(placeholders)})
-                    """
-                    db.execute(text(insert_query), color_data)
-                    batch_inserted += 1
-
-            # Commit batch
-            db.commit()
+            results = db.execute(upsert_stmt, batch).fetchall()
+
+            batch_inserted = sum(1 for row in results if row.inserted)
+            batch_updated = len(batch) - batch_inserted
             total_inserted += batch_inserted
             total_updated += batch_updated
 
+            logger.info("Universal Colors batch %d/%d: +%d ~%d",
+                        i // batch_size + 1, total_batches, batch_inserted, batch_updated)
+
         except Exception as e:
-            db.rollback()
             logger.error(f"Error in universal colors batch {i//batch_size + 1}: {e}")
             raise
 
     return total_inserted, total_updated
 
 
-def import_hm_colors_from_excel(excel_file_path: str, db: Session):
-    """Import H&M colors from Excel file - reads Sheet2"""
+def read_hm_colors_from_excel(excel_file_path: str) -> Tuple[List[Dict], int]:
+    """Read and clean H&M colors from Excel file (Sheet2) - no database access"""
     if not os.path.exists(excel_file_path):
         logger.info(f"Excel file not found: {excel_file_path} - skipping H&M color import")
-        return 0, 0
+        return [], 0
 
     try:
         logger.info(f"Reading H&M colors from Excel: {excel_file_path}")
@@ -181,7 +201,7 @@ def import_hm_colors_from_excel(excel_file_path: str, db: Session):
         # Check required columns
         if not column_mapping['color_code'] or not column_mapping['color_master']:
             logger.error(f"Missing required columns. Found: {list(df.columns)}")
-            return 0, 0
+            return [], 0
 
         # Process color data
         colors_data = []
@@ -213,26 +233,59 @@ def import_hm_colors_from_excel(excel_file_path: str, db: Session):
                 })
 
             except Exception as e:
-                logger.error(f"Error processing H&M color row {index + 1}: {e}")
+                logger.error("Error processing H&M color row %d: %s", index + 1, e)
                 continue
 
-        if len(colors_data) == 0:
-            logger.warning("No valid H&M color data to import!")
-            return 0, 0
+        return colors_data, skipped_count
+
+    except Exception as e:
+        logger.error(f"Error reading H&M colors from Excel: {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+        return [], 0
+
+
+def import_hm_colors(db: Session, colors_data: List[Dict], skipped_count: int = 0):
+    """Write already-parsed H&M colors to the database"""
+    if len(colors_data) == 0:
+        logger.warning("No valid H&M color data to import!")
+        return 0, 0
 
+    try:
         logger.info(f"Processing {len(colors_data)} H&M colors (skipped {skipped_count} invalid rows)")
 
         # Batch insert
-        imported_count, updated_count = batch_insert_hm_colors(db, colors_data, batch_size=500)
+        imported_count, updated_count = batch_insert_hm_colors(db, colors_data, batch_size=1000)
 
         logger.info(f"H&M Colors - Imported: {imported_count}, Updated: {updated_count}, Skipped: {skipped_count}")
         return imported_count, updated_count
 
     except Exception as e:
+        # Re-raised so run_migration() rolls back instead of committing a partial import
         logger.error(f"Error importing H&M colors from Excel: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
-        return 0, 0
+        raise
+
+
+def import_hm_colors_from_excel(excel_file_path: str, db: Session):
+    """Import H&M colors from Excel file - reads Sheet2"""
+    colors_data, skipped_count = read_hm_colors_from_excel(excel_file_path)
+    return import_hm_colors(db, colors_data, skipped_count)
+
+
+# ASCII code -> nibble value for hex digits (both cases)
+_HEX_NIBBLES = [0] * 256
+for _i, _ch in enumerate("0123456789abcdef"):
+    _HEX_NIBBLES[ord(_ch)] = _i
+    _HEX_NIBBLES[ord(_ch.upper())] = _i
+
+
+def hex_to_rgb(hex_code: str, nibbles=_HEX_NIBBLES):
+    """Convert a '#RRGGBB' hex code to an (r, g, b) tuple using a nibble lookup table"""
+    return (
+        (nibbles[ord(hex_code[1])] << 4) | nibbles[ord(hex_code[2])],
+        (nibbles[ord(hex_code[3])] << 4) | nibbles[ord(hex_code[4])],
+        (nibbles[ord(hex_code[5])] << 4) | nibbles[ord(hex_code[6])],
+    )
 
 
 def get_comprehensive_universal_colors():
@@ -359,57 +412,72 @@ def get_comprehensive_universal_colors():
         ],
     }
 
-    # Generate colors with proper codes
-    color_id = 1
-    for family_name, family_colors in color_families.items():
-        for color_info in family_colors:
-            # Convert hex to RGB
-            hex_code = color_info["hex"]
-            rgb_r = int(hex_code[1:3], 16)
-            rgb_g = int(hex_code[3:5], 16)
-            rgb_b = int(hex_code[5:7], 16)
-
-            # Generate TCX code from Pantone if available
-            tcx_code = None
-            if color_info.get("pantone"):
-                tcx_code = f"{color_info['pantone']} TCX"
-
-            color_data = {
-                'color_code': f"UC-{color_id:04d}",
-                'color_name': color_info["name"],
-                'display_name': color_info["name"],
-                'color_family': color_info["family"],
-                'color_type': color_info["type"],
-                'color_value': color_info["value"],
-                'finish_type': 'RAW',
-                'hex_code': hex_code,
-                'rgb_r': rgb_r,
-                'rgb_g': rgb_g,
-                'rgb_b': rgb_b,
-                'pantone_code': color_info.get("pantone"),
-                'tcx_code': tcx_code,
-                'tpx_code': None,
-                'description': f"{color_info['name']} - {color_info['family']} family color",
-                'season': 'AW25',
-                'year': 2025,
-                'is_active': True
-            }
-
-            colors.append(color_data)
-            color_id += 1
+    # Generate colors with proper codes - codes and descriptions are built up front
+    flat_colors = [color_info for family_colors in color_families.values() for color_info in family_colors]
+    color_codes = ["UC-%04d" % color_id for color_id in range(1, len(flat_colors) + 1)]
+    descriptions = ["%s - %s family color" % (c["name"], c["family"]) for c in flat_colors]
+
+    for color_info, color_code, description in zip(flat_colors, color_codes, descriptions):
+        # Convert hex to RGB
+        hex_code = color_info["hex"]
+        rgb_r, rgb_g, rgb_b = hex_to_rgb(hex_code)
+
+        # Generate TCX code from Pantone if available
+        tcx_code = None
+        if color_info.get("pantone"):
+            tcx_code = f"{color_info['pantone']} TCX"
+
+        color_data = {
+            'color_code': color_code,
+            'color_name': color_info["name"],
+            'display_name': color_info["name"],
+            'color_family': color_info["family"],
+            'color_type': color_info["type"],
+            'color_value': color_info["value"],
+            'finish_type': 'RAW',
+            'hex_code': hex_code,
+            'rgb_r': rgb_r,
+            'rgb_g': rgb_g,
+            'rgb_b': rgb_b,
+            'pantone_code': color_info.get("pantone"),
+            'tcx_code': tcx_code,
+            'tpx_code': None,
+            'description': description,
+            'season': 'AW25',
+            'year': 2025,
+            'is_active': True
+        }
+
+        colors.append(color_data)
 
     return colors
 
 
+UNIVERSAL_COLORS_HASH_KEY = "universal_colors_hash"
+
+
 def import_universal_colors(db: Session):
-    """Import comprehensive universal colors"""
+    """Import comprehensive universal colors, skipping when the dataset is unchanged"""
     colors_data = get_comprehensive_universal_colors()
 
     if len(colors_data) == 0:
         logger.warning("No universal color data to import!")
         return 0, 0
 
-    imported_count, updated_count = batch_insert_universal_colors(db, colors_data, batch_size=500)
+    digest = hashlib.sha256(json.dumps(colors_data, sort_keys=True).encode()).hexdigest()
+    if get_migration_state(db, UNIVERSAL_COLORS_HASH_KEY) == digest:
+        logger.info("Universal colors already at current revision - skipping import")
+        return 0, 0
+
+    table_empty = db.execute(text("SELECT 1 FROM universal_colors LIMIT 1")).fetchone() is None
+    if table_empty:
+        # Fresh database - stream the rows in with COPY; codes inserted meanwhile
+        # by a concurrent seeder are skipped by the staging INSERT's ON CONFLICT
+        imported_count, updated_count = copy_universal_colors(db, colors_data), 0
+    else:
+        imported_count, updated_count = batch_insert_universal_colors(db, colors_data, batch_size=500)
+
+    set_migration_state(db, UNIVERSAL_COLORS_HASH_KEY, digest)
     logger.info(f"Universal Colors - Imported: {imported_count}, Updated: {updated_count}")
 
     return imported_count, updated_count
@@ -421,12 +489,19 @@ def run_migration():
     logger.info("IMPORTING COMPREHENSIVE COLOR DATA")
     logger.info("=" * 60)
 
-    db = SessionLocalSizeColor()
+    # Bulk engine: the H&M update batches are executemany calls pipelined with execute_batch
+    db = SessionLocalSizeColorBulk()
 
     try:
+        # Whole import runs as one transaction; the data is re-importable, so
+        # there is no need to wait for a WAL flush per batch.
+        if db.bind.dialect.name == "postgresql":
+            db.execute(text("SET LOCAL synchronous_commit = OFF"))
+
         # Try to import H&M colors from Excel (if file exists)
         # Check multiple possible locations
         excel_paths = [
+            os.environ.get("HM_COLORS_XLSX"),   # Explicit override
             "data/hm_colors.xlsx",              # Backend data folder
             "/app/data/hm_colors.xlsx",         # Docker mounted path
             "../H&M colors.xlsx",               # Project root (from backend)
@@ -435,22 +510,21 @@ def run_migration():
         ]
 
         hm_imported, hm_updated = 0, 0
-        excel_found = False
+        excel_path = next((Path(p) for p in excel_paths if p and Path(p).is_file()), None)
 
-        for excel_path in excel_paths:
-            if os.path.exists(excel_path):
-                logger.info(f"Found H&M Excel file at: {excel_path}")
-                hm_imported, hm_updated = import_hm_colors_from_excel(excel_path, db)
-                excel_found = True
-                break
-
-        if not excel_found:
+        if excel_path is not None:
+            logger.info(f"Found H&M Excel file at: {excel_path}")
+            hm_colors_data, hm_skipped = read_hm_colors_from_excel(str(excel_path))
+            hm_imported, hm_updated = import_hm_colors(db, hm_colors_data, hm_skipped)
+        else:
             logger.info("No H&M Excel file found in any expected location - skipping H&M color import")
-            logger.info(f"Searched paths: {excel_paths}")
+            logger.info(f"Searched paths: {[p for p in excel_paths if p]}")
 
         # Import universal colors
         universal_imported, universal_updated = import_universal_colors(db)
 
+        db.commit()
+
         # Summary
         total_processed = hm_imported + hm_updated + universal_imported + universal_updated
 
@@ -9,14 +9,20 @@ Affected tables:
 - sample_required_materials: uom -> unit_id
 - style_variant_materials: uom -> unit_id, weight_uom -> weight_unit_id
 
+Unit text is matched on NULLIF(TRIM(col), ''), so values that differ only by
+surrounding whitespace (e.g. ' kg ') are migrated like their trimmed text.
+
 Requirements: 2.1, 2.3, 2.4, 2.5
 
 Usage:
-    python backend/migrations/migrate_unit_data.py
+    python backend/migrations/migrate_unit_data.py [--defer-index-maintenance]
 """
 
+import argparse
 import sys
 import os
+from collections import Counter
+from contextlib import contextmanager
 from pathlib import Path
 
 # Add backend directory to path
@@ -24,11 +30,16 @@ backend_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_dir))
 
 from sqlalchemy import text
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import TextClause
 from core.database import SessionLocalSamples, SessionLocalUnits
 from modules.materials.services.unit_mapping_service import get_unit_mapping_service
 import logging
+from dataclasses import dataclass, field
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional
 
 # Configure logging
 logging.basicConfig(
@@ -37,31 +48,125 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# table -> (column counted for the table total or None for all rows,
+#           [(text column, id column, sample record columns, sample log format), ...])
+UNIT_MIGRATIONS = {
+    'material_master': ('uom', [
+        ('uom', 'unit_id', ['id', 'material_name', 'uom'],
+         "    - Record ID %s: %s (%s)"),
+    ]),
+    'sample_required_materials': ('uom', [
+        ('uom', 'unit_id', ['id', 'sample_request_id', 'product_name', 'required_quantity', 'uom'],
+         "    - Record ID %s, Sample %s: %s - %s %s"),
+    ]),
+    'style_variant_materials': (None, [
+        ('uom', 'unit_id', ['id', 'style_variant_id', 'product_name', 'required_quantity', 'uom'],
+         "    - Record ID %s, Variant %s: %s - %s %s"),
+        ('weight_uom', 'weight_unit_id', ['id', 'style_variant_id', 'product_name', 'weight', 'weight_uom'],
+         "    - Record ID %s, Variant %s: %s - %s %s"),
+    ]),
+}
+
+# (table, unit text column) pairs handled by this migration
+UNIT_TEXT_COLUMNS = [
+    (table_name, text_column)
+    for table_name, (_, columns) in UNIT_MIGRATIONS.items()
+    for text_column, *_ in columns
+]
+
+
+def trimmed_unit_expr(column_name: str, alias: Optional[str] = None) -> str:
+    """
+    SQL expression for a unit text column with blanks folded to NULL.
+    
+    Every query in this migration filters and joins on this exact expression
+    so the functional indexes from ensure_unit_text_indexes() can be used.
+    """
+    column_ref = f"{alias}.{column_name}" if alias else column_name
+    return f"NULLIF(TRIM({column_ref}), '')"
+
+
+def normalize_unit_key(unit_text: str) -> str:
+    """
+    Normalize unit text for de-duplication: NFKC, casefold and strip in one pass.
+    
+    Examples:
+        >>> normalize_unit_key("  KG ")
+        'kg'
+        >>> normalize_unit_key("ｐｃｓ")
+        'pcs'
+    """
+    return unicodedata.normalize('NFKC', unit_text).casefold().strip()
+
+
+# Compiled statements keyed by (kind, table, column, ...) - identifiers are
+# whitelisted and baked in once, only values are bound per execution
+_STATEMENT_CACHE: Dict[tuple, TextClause] = {}
+
+
+def cached_statement(key: tuple, build: Callable[[], str]) -> TextClause:
+    """
+    Return the cached text() statement for key, building it on first use.
+    
+    Args:
+        key: (kind, table_name, column_name(s), ...) cache key
+        build: Callable returning the SQL string for this key
+    
+    Raises:
+        ValueError: If a (table_name, column_name) pair is not a known unit column
+    """
+    statement = _STATEMENT_CACHE.get(key)
+    if statement is None:
+        table_name, columns = key[1], key[2]
+        for column_name in (columns if isinstance(columns, tuple) else (columns,)):
+            if (table_name, column_name) not in UNIT_TEXT_COLUMNS:
+                raise ValueError(f"Unsupported unit column: {table_name}.{column_name}")
+        statement = _STATEMENT_CACHE[key] = text(build())
+    return statement
+
+
+@dataclass(slots=True)
+class ColumnStats:
+    """Migration statistics for one unit text -> unit id column."""
+    updated: int = 0
+    unmapped: int = 0
+    unmapped_units: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class TableStats:
+    """Migration statistics for a table, keyed by id column."""
+    total: int = 0
+    columns: Dict[str, ColumnStats] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class MigrationStats:
+    """Per-table statistics, one attribute per migrated table."""
+    material_master: TableStats = field(default_factory=TableStats)
+    sample_required_materials: TableStats = field(default_factory=TableStats)
+    style_variant_materials: TableStats = field(default_factory=TableStats)
+
 
 class UnitDataMigration:
     """
     Handles migration of plain text unit values to unit_id references.
     """
     
-    def __init__(self):
+    def __init__(self, defer_index_maintenance: bool = False):
+        """
+        Args:
+            defer_index_maintenance: Drop secondary indexes on the unit id columns
+                and disable user triggers while the bulk UPDATEs run, then restore
+                them (opt-in, see --defer-index-maintenance)
+        """
+        self.defer_index_maintenance = defer_index_maintenance
         self.db_samples = SessionLocalSamples()
         self.db_units = SessionLocalUnits()
         self.mapping_service = get_unit_mapping_service()
         
         # Statistics
-        self.stats = {
-            'material_master': {'total': 0, 'updated': 0, 'unmapped': 0, 'unmapped_units': []},
-            'sample_required_materials': {'total': 0, 'updated': 0, 'unmapped': 0, 'unmapped_units': []},
-            'style_variant_materials': {
-                'total': 0,
-                'unit_id_updated': 0,
-                'weight_unit_id_updated': 0,
-                'unit_id_unmapped': 0,
-                'weight_unit_id_unmapped': 0,
-                'unmapped_units': [],
-                'unmapped_weight_units': []
-            }
-        }
+        self.stats = MigrationStats()
     
     def __enter__(self):
         return self
@@ -71,6 +176,27 @@ class UnitDataMigration:
         self.db_samples.close()
         self.db_units.close()
     
+    def ensure_unit_text_indexes(self) -> None:
+        """
+        Create functional indexes on the trimmed unit text columns.
+        
+        Lets the DISTINCT scans and the UPDATE join use an index instead of
+        evaluating TRIM() against every row. They only serve this migration and
+        have no model counterpart, so run() drops them again when it ends.
+        """
+        for table_name, column_name in UNIT_TEXT_COLUMNS:
+            self.db_samples.execute(text(f"""
+                CREATE INDEX IF NOT EXISTS ix_{table_name}_{column_name}_trimmed
+                ON {table_name} (({trimmed_unit_expr(column_name)}))
+            """))
+        self.db_samples.commit()
+    
+    def drop_unit_text_indexes(self) -> None:
+        """Drop the functional indexes created by ensure_unit_text_indexes()."""
+        for table_name, column_name in UNIT_TEXT_COLUMNS:
+            self.db_samples.execute(text(f"DROP INDEX IF EXISTS ix_{table_name}_{column_name}_trimmed"))
+        self.db_samples.commit()
+    
     def get_distinct_units(self, table_name: str, column_name: str) -> List[str]:
         """
         Get all distinct unit values from a table column.
@@ -80,24 +206,45 @@ class UnitDataMigration:
             column_name: Name of the column containing unit text
         
         Returns:
-            List of distinct unit text values (excluding NULL and empty strings)
+            List of distinct trimmed unit text values (excluding NULL and empty strings)
         """
         logger.info(f"Querying distinct {column_name} values from {table_name}...")
         
-        query = text(f"""
-            SELECT DISTINCT {column_name}
+        unit_expr = trimmed_unit_expr(column_name)
+        query = cached_statement(('distinct', table_name, column_name), lambda: f"""
+            SELECT DISTINCT {unit_expr}
             FROM {table_name}
-            WHERE {column_name} IS NOT NULL
-            AND TRIM({column_name}) != ''
-            ORDER BY {column_name}
+            WHERE {unit_expr} IS NOT NULL
         """)
         
-        result = self.db_samples.execute(query)
-        distinct_values = [row[0] for row in result]
+        # Stream through a server-side cursor and collect straight into a set;
+        # yield_per (which implies stream_results) is set on this statement only,
+        # so later statements on the session keep using a normal cursor
+        result = self.db_samples.execute(query.execution_options(yield_per=10000))
+        distinct_values = sorted({row[0] for row in result})
         
         logger.info(f"Found {len(distinct_values)} distinct {column_name} values in {table_name}")
         return distinct_values
     
+    def count_rows(self, db: Session, table_name: str, count_column: Optional[str] = None) -> int:
+        """
+        Count the rows of a table for its migration statistics.
+        
+        Args:
+            db: Samples session to query
+            table_name: Name of the table
+            count_column: If given, only rows where this column is NOT NULL are counted
+        
+        Returns:
+            Row count
+        """
+        count_filter = f"WHERE {count_column} IS NOT NULL" if count_column else ""
+        count_columns = (count_column,) if count_column else ()
+        query = cached_statement(('count', table_name, count_columns), lambda: f"""
+            SELECT COUNT(*) FROM {table_name} {count_filter}
+        """)
+        return db.execute(query).scalar()
+    
     def create_unit_mapping(self, unit_texts: List[str]) -> Dict[str, Optional[int]]:
         """
         Create mapping from plain text units to unit_id values.
@@ -110,11 +257,26 @@ class UnitDataMigration:
         """
         logger.info(f"Creating unit mapping for {len(unit_texts)} distinct units...")
         
+        # Normalize once; texts that collapse to the same key (e.g. 'KG',
+        # ' kg', full-width 'ｋｇ') are resolved through one representative
+        normalized = {unit_text: normalize_unit_key(unit_text) for unit_text in unit_texts}
+        representatives = {}
+        for unit_text, key in normalized.items():
+            representatives.setdefault(key, unit_text)
+        
         # Use batch mapping for efficiency
-        mapping = self.mapping_service.batch_map_texts_to_unit_ids(
-            unit_texts,
-            self.db_units
-        )
+        resolved = {}
+        if representatives:
+            resolved = self.mapping_service.batch_map_texts_to_unit_ids(
+                list(representatives.values()),
+                self.db_units
+            )
+        
+        # Fan the resolved ids back out to every original text for the UPDATE
+        mapping = {
+            unit_text: resolved.get(representatives[key])
+            for unit_text, key in normalized.items()
+        }
         
         # Log mapping statistics
         mapped_count = sum(1 for unit_id in mapping.values() if unit_id is not None)
@@ -129,287 +291,288 @@ class UnitDataMigration:
         
         return mapping
     
-    def migrate_material_master(self) -> None:
+    def resolve_unit_mappings(self) -> Dict[str, Dict[str, Dict[str, Optional[int]]]]:
         """
-        Migrate material_master table: uom -> unit_id
+        Resolve the distinct units of every migrated column in one mapping call.
+        
+        Returns:
+            Dictionary of table name -> column name -> (unit text -> unit_id)
         """
-        logger.info("=" * 80)
-        logger.info("Migrating material_master table...")
-        logger.info("=" * 80)
+        distinct_by_column = {
+            (table_name, column_name): self.get_distinct_units(table_name, column_name)
+            for table_name, column_name in UNIT_TEXT_COLUMNS
+        }
+        all_texts = sorted({unit_text for values in distinct_by_column.values() for unit_text in values})
+        global_mapping = self.create_unit_mapping(all_texts)
         
-        # Get distinct uom values
-        distinct_uoms = self.get_distinct_units('material_master', 'uom')
+        mappings: Dict[str, Dict[str, Dict[str, Optional[int]]]] = {}
+        for (table_name, column_name), values in distinct_by_column.items():
+            mappings.setdefault(table_name, {})[column_name] = {
+                unit_text: global_mapping[unit_text] for unit_text in values
+            }
+        return mappings
+    
+    @contextmanager
+    def deferred_index_maintenance(self, db: Session, table_name: str, id_column: str):
+        """
+        Drop secondary indexes on id_column and disable user triggers for the block.
+        
+        No-op unless defer_index_maintenance is enabled. Indexes are recreated from
+        their saved definitions and triggers re-enabled afterwards, also when the
+        block fails: its work runs in a savepoint that is rolled back first, so the
+        restore can still execute. Everything runs inside the current transaction
+        (so plain DROP INDEX, not CONCURRENTLY). The table is resolved through the
+        search_path like the unqualified UPDATE, so indexes of same-named tables in
+        other schemas are never touched.
         
-        if not distinct_uoms:
-            logger.info("No uom values to migrate in material_master")
+        Args:
+            db: Samples session running the block
+            table_name: Table being updated
+            id_column: Unit id column being populated
+        """
+        if not self.defer_index_maintenance:
+            yield
             return
         
-        # Create mapping
-        uom_mapping = self.create_unit_mapping(distinct_uoms)
-        
-        # Get total count
-        count_query = text("SELECT COUNT(*) FROM material_master WHERE uom IS NOT NULL")
-        total_count = self.db_samples.execute(count_query).scalar()
-        self.stats['material_master']['total'] = total_count
-        
-        logger.info(f"Updating {total_count} records in material_master...")
-        
-        # Update records for each mapped unit
-        updated_count = 0
-        unmapped_units = []
-        
-        for uom_text, unit_id in uom_mapping.items():
-            if unit_id is not None:
-                # Update records with this uom value
-                update_query = text("""
-                    UPDATE material_master
-                    SET unit_id = :unit_id
-                    WHERE uom = :uom_text
-                    AND unit_id IS NULL
-                """)
-                
-                result = self.db_samples.execute(
-                    update_query,
-                    {'unit_id': unit_id, 'uom_text': uom_text}
-                )
-                
-                rows_updated = result.rowcount
-                updated_count += rows_updated
-                
-                logger.info(f"  Updated {rows_updated} records: '{uom_text}' -> unit_id={unit_id}")
-            else:
-                # Log unmapped unit with record details
-                unmapped_units.append(uom_text)
-                
-                # Get sample records with this unmapped unit
-                sample_query = text("""
-                    SELECT id, material_name, uom
-                    FROM material_master
-                    WHERE uom = :uom_text
-                    LIMIT 5
-                """)
-                
-                sample_records = self.db_samples.execute(
-                    sample_query,
-                    {'uom_text': uom_text}
-                ).fetchall()
-                
-                logger.warning(f"  Unmapped unit: '{uom_text}'")
-                for record in sample_records:
-                    logger.warning(f"    - Record ID {record[0]}: {record[1]} ({record[2]})")
+        # indexrelid::regclass renders the schema-qualified, quoted index name
+        index_query = text("""
+            SELECT CAST(CAST(x.indexrelid AS regclass) AS text), pg_get_indexdef(x.indexrelid)
+            FROM pg_index x
+            JOIN pg_attribute a ON a.attrelid = x.indrelid AND a.attnum = ANY(x.indkey)
+            WHERE x.indrelid = CAST(:table_name AS regclass)
+            AND a.attname = :column_name
+            AND NOT x.indisprimary
+            AND NOT x.indisunique
+        """)
+        indexes = db.execute(
+            index_query,
+            {'table_name': table_name, 'column_name': id_column}
+        ).fetchall()
         
-        # Commit changes
-        self.db_samples.commit()
+        for index_name, _ in indexes:
+            db.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+        db.execute(text(f"ALTER TABLE {table_name} DISABLE TRIGGER USER"))
+        logger.info(f"  Deferred {len(indexes)} index(es) and user triggers on {table_name}.{id_column}")
+        
+        savepoint = db.begin_nested()
+        try:
+            yield
+        except Exception:
+            # Leave the transaction usable so the restore below can run
+            savepoint.rollback()
+            raise
+        else:
+            savepoint.commit()
+        finally:
+            for _, index_definition in indexes:
+                db.execute(text(index_definition))
+            db.execute(text(f"ALTER TABLE {table_name} ENABLE TRIGGER USER"))
+            logger.info(f"  Restored {len(indexes)} index(es) and user triggers on {table_name}.{id_column}")
+    
+    def bulk_update_unit_ids(
+        self,
+        db: Session,
+        table_name: str,
+        text_column: str,
+        id_column: str,
+        mapping: Dict[str, Optional[int]]
+    ) -> int:
+        """
+        Set id_column from text_column for every mapped unit in one UPDATE.
+        
+        The mapping is sent as two parallel arrays, unnested and joined against
+        the target table, so all distinct unit values are updated in a single
+        round trip instead of one UPDATE per value. Rows are matched on the
+        trimmed text, so whitespace-padded values are updated as well.
         
-        # Update statistics
-        self.stats['material_master']['updated'] = updated_count
-        self.stats['material_master']['unmapped'] = len(unmapped_units)
-        self.stats['material_master']['unmapped_units'] = unmapped_units
+        Args:
+            db: Samples session to update through
+            table_name: Name of the table to update
+            text_column: Column containing plain text unit
+            id_column: Column to populate with unit_id
+            mapping: Dictionary mapping unit text -> unit_id (None entries are skipped)
         
-        logger.info(f"material_master migration complete: {updated_count}/{total_count} records updated")
+        Returns:
+            Number of rows updated
+        """
+        mapped = [(unit_text, unit_id) for unit_text, unit_id in mapping.items() if unit_id is not None]
+        if not mapped:
+            # Nothing resolvable - skip the UPDATE (and any deferred index DDL) entirely
+            logger.info(f"  No mapped {text_column} values for {table_name} - skipping update")
+            return 0
+        
+        if len(mapped) == 1:
+            # Single unit value: a plain keyed UPDATE, no VALUES join needed
+            unit_text, unit_id = mapped[0]
+            params = {'unit_text': unit_text, 'unit_id': unit_id}
+            update_query = cached_statement(('update_single', table_name, text_column, id_column), lambda: f"""
+                UPDATE {table_name}
+                SET {id_column} = :unit_id
+                WHERE {trimmed_unit_expr(text_column)} = :unit_text
+                AND {id_column} IS NULL
+                RETURNING {trimmed_unit_expr(text_column)}
+            """)
+        else:
+            # Two array parameters keep the statement text the same whatever
+            # the mapping size, so it is parsed and planned once per column
+            params = {
+                'unit_texts': [unit_text for unit_text, _ in mapped],
+                'unit_ids': [unit_id for _, unit_id in mapped],
+            }
+            update_query = cached_statement(('update', table_name, text_column, id_column), lambda: f"""
+                UPDATE {table_name} AS t
+                SET {id_column} = v.unit_id
+                FROM unnest(CAST(:unit_texts AS text[]), CAST(:unit_ids AS int[])) AS v(unit_text, unit_id)
+                WHERE {trimmed_unit_expr(text_column, 't')} = v.unit_text
+                AND t.{id_column} IS NULL
+                RETURNING v.unit_text
+            """)
+        
+        with self.deferred_index_maintenance(db, table_name, id_column):
+            # RETURNING gives per-unit counts from the same statement
+            updated_per_unit = Counter(row[0] for row in db.execute(update_query, params))
+        
+        unit_ids = dict(mapped)
+        for unit_text, rows_updated in sorted(updated_per_unit.items()):
+            logger.info("  Updated %d records: %s '%s' -> %s=%s",
+                        rows_updated, text_column, unit_text, id_column, unit_ids[unit_text])
+        
+        updated_count = sum(updated_per_unit.values())
+        logger.info("  Updated %d records in %s.%s from %d mapped %s values",
+                    updated_count, table_name, id_column, len(mapped), text_column)
+        return updated_count
     
-    def migrate_sample_required_materials(self) -> None:
+    def fetch_unmapped_samples(
+        self,
+        db: Session,
+        table_name: str,
+        text_column: str,
+        columns: List[str],
+        unit_texts: List[str],
+        limit: int = 5
+    ) -> Dict[str, List[Tuple]]:
         """
-        Migrate sample_required_materials table: uom -> unit_id
+        Fetch up to `limit` sample records for each unmapped unit in one query.
+        
+        Args:
+            db: Samples session to query
+            table_name: Name of the table to sample
+            text_column: Column containing plain text unit
+            columns: Columns to return for each sample record
+            unit_texts: Unmapped unit text values
+            limit: Maximum records per unit value
+        
+        Returns:
+            Dictionary mapping unit text -> list of sample records
         """
-        logger.info("=" * 80)
-        logger.info("Migrating sample_required_materials table...")
-        logger.info("=" * 80)
+        samples: Dict[str, List[Tuple]] = {unit_text: [] for unit_text in unit_texts}
+        if not unit_texts:
+            return samples
+        
+        column_list = ', '.join(columns)
+        unit_expr = trimmed_unit_expr(text_column)
+        sample_query = cached_statement(('samples', table_name, text_column, tuple(columns)), lambda: f"""
+            SELECT {column_list}, unit_key
+            FROM (
+                SELECT {column_list},
+                       {unit_expr} AS unit_key,
+                       ROW_NUMBER() OVER (PARTITION BY {unit_expr} ORDER BY id) AS rn
+                FROM {table_name}
+                WHERE {unit_expr} = ANY(:unit_texts)
+            ) s
+            WHERE rn <= :limit
+        """)
         
-        # Get distinct uom values
-        distinct_uoms = self.get_distinct_units('sample_required_materials', 'uom')
+        result = db.execute(sample_query, {'unit_texts': list(unit_texts), 'limit': limit})
+        for record in result:
+            samples[record[-1]].append(tuple(record[:-1]))
         
-        if not distinct_uoms:
-            logger.info("No uom values to migrate in sample_required_materials")
-            return
+        return samples
+    
+    def _migrate_column(
+        self,
+        db: Session,
+        table_name: str,
+        text_column: str,
+        id_column: str,
+        sample_columns: List[str],
+        sample_format: str,
+        mapping: Dict[str, Optional[int]]
+    ) -> ColumnStats:
+        """
+        Migrate one unit text column to its unit id column.
         
-        # Create mapping
-        uom_mapping = self.create_unit_mapping(distinct_uoms)
-        
-        # Get total count
-        count_query = text("SELECT COUNT(*) FROM sample_required_materials WHERE uom IS NOT NULL")
-        total_count = self.db_samples.execute(count_query).scalar()
-        self.stats['sample_required_materials']['total'] = total_count
-        
-        logger.info(f"Updating {total_count} records in sample_required_materials...")
-        
-        # Update records for each mapped unit
-        updated_count = 0
-        unmapped_units = []
-        
-        for uom_text, unit_id in uom_mapping.items():
-            if unit_id is not None:
-                # Update records with this uom value
-                update_query = text("""
-                    UPDATE sample_required_materials
-                    SET unit_id = :unit_id
-                    WHERE uom = :uom_text
-                    AND unit_id IS NULL
-                """)
-                
-                result = self.db_samples.execute(
-                    update_query,
-                    {'unit_id': unit_id, 'uom_text': uom_text}
-                )
-                
-                rows_updated = result.rowcount
-                updated_count += rows_updated
-                
-                logger.info(f"  Updated {rows_updated} records: '{uom_text}' -> unit_id={unit_id}")
-            else:
-                # Log unmapped unit with record details
-                unmapped_units.append(uom_text)
-                
-                # Get sample records with this unmapped unit
-                sample_query = text("""
-                    SELECT id, sample_request_id, product_name, required_quantity, uom
-                    FROM sample_required_materials
-                    WHERE uom = :uom_text
-                    LIMIT 5
-                """)
-                
-                sample_records = self.db_samples.execute(
-                    sample_query,
-                    {'uom_text': uom_text}
-                ).fetchall()
-                
-                logger.warning(f"  Unmapped unit: '{uom_text}'")
-                for record in sample_records:
-                    logger.warning(f"    - Record ID {record[0]}, Sample {record[1]}: {record[2]} - {record[3]} {record[4]}")
+        Args:
+            db: Samples session to update through
+            table_name: Name of the table to update
+            text_column: Column containing plain text unit
+            id_column: Column to populate with unit_id
+            sample_columns: Columns logged for records with an unmapped unit
+            sample_format: Log format for one sample record
+            mapping: Dictionary mapping unit text -> unit_id (or None if unmapped)
         
-        # Commit changes
-        self.db_samples.commit()
+        Returns:
+            Statistics for this column
+        """
+        logger.info("Migrating %s field (%d distinct values)...", text_column, len(mapping))
         
-        # Update statistics
-        self.stats['sample_required_materials']['updated'] = updated_count
-        self.stats['sample_required_materials']['unmapped'] = len(unmapped_units)
-        self.stats['sample_required_materials']['unmapped_units'] = unmapped_units
+        updated_count = self.bulk_update_unit_ids(db, table_name, text_column, id_column, mapping)
+        unmapped_units = [unit_text for unit_text, unit_id in mapping.items() if unit_id is None]
         
-        logger.info(f"sample_required_materials migration complete: {updated_count}/{total_count} records updated")
+        # Log unmapped units with sample record details (one query for all units)
+        if unmapped_units and logger.isEnabledFor(logging.WARNING):
+            samples = self.fetch_unmapped_samples(db, table_name, text_column, sample_columns, unmapped_units)
+            for unit_text in unmapped_units:
+                logger.warning("  Unmapped %s: '%s'", text_column, unit_text)
+                for record in samples[unit_text]:
+                    logger.warning(sample_format, *record)
+        
+        return ColumnStats(updated=updated_count, unmapped=len(unmapped_units), unmapped_units=unmapped_units)
     
-    def migrate_style_variant_materials(self) -> None:
+    def migrate_table(
+        self,
+        db: Session,
+        table_name: str,
+        mappings: Dict[str, Dict[str, Optional[int]]]
+    ) -> TableStats:
         """
-        Migrate style_variant_materials table: uom -> unit_id, weight_uom -> weight_unit_id
+        Migrate every unit column of a table as configured in UNIT_MIGRATIONS.
+        
+        Args:
+            db: Samples session to migrate the table on
+            table_name: Key of UNIT_MIGRATIONS to migrate
+            mappings: Column name -> (unit text -> unit_id), from resolve_unit_mappings()
+        
+        Returns:
+            Statistics for this table (also stored on self.stats)
         """
         logger.info("=" * 80)
-        logger.info("Migrating style_variant_materials table...")
+        logger.info("Migrating %s table...", table_name)
         logger.info("=" * 80)
         
-        # Get distinct uom values
-        distinct_uoms = self.get_distinct_units('style_variant_materials', 'uom')
-        distinct_weight_uoms = self.get_distinct_units('style_variant_materials', 'weight_uom')
+        count_column, columns = UNIT_MIGRATIONS[table_name]
+        stats = TableStats()
         
-        # Get total count
-        count_query = text("SELECT COUNT(*) FROM style_variant_materials")
-        total_count = self.db_samples.execute(count_query).scalar()
-        self.stats['style_variant_materials']['total'] = total_count
-        
-        # Migrate uom -> unit_id
-        if distinct_uoms:
-            logger.info(f"Migrating uom field ({len(distinct_uoms)} distinct values)...")
-            uom_mapping = self.create_unit_mapping(distinct_uoms)
-            
-            unit_id_updated = 0
-            unmapped_units = []
-            
-            for uom_text, unit_id in uom_mapping.items():
-                if unit_id is not None:
-                    update_query = text("""
-                        UPDATE style_variant_materials
-                        SET unit_id = :unit_id
-                        WHERE uom = :uom_text
-                        AND unit_id IS NULL
-                    """)
-                    
-                    result = self.db_samples.execute(
-                        update_query,
-                        {'unit_id': unit_id, 'uom_text': uom_text}
-                    )
-                    
-                    rows_updated = result.rowcount
-                    unit_id_updated += rows_updated
-                    
-                    logger.info(f"  Updated {rows_updated} records: uom '{uom_text}' -> unit_id={unit_id}")
-                else:
-                    unmapped_units.append(uom_text)
-                    
-                    # Get sample records
-                    sample_query = text("""
-                        SELECT id, style_variant_id, product_name, required_quantity, uom
-                        FROM style_variant_materials
-                        WHERE uom = :uom_text
-                        LIMIT 5
-                    """)
-                    
-                    sample_records = self.db_samples.execute(
-                        sample_query,
-                        {'uom_text': uom_text}
-                    ).fetchall()
-                    
-                    logger.warning(f"  Unmapped uom: '{uom_text}'")
-                    for record in sample_records:
-                        logger.warning(f"    - Record ID {record[0]}, Variant {record[1]}: {record[2]} - {record[3]} {record[4]}")
+        # One explicit transaction per table; committed when the block exits
+        with db.begin():
+            stats.total = self.count_rows(db, table_name, count_column)
             
-            self.stats['style_variant_materials']['unit_id_updated'] = unit_id_updated
-            self.stats['style_variant_materials']['unit_id_unmapped'] = len(unmapped_units)
-            self.stats['style_variant_materials']['unmapped_units'] = unmapped_units
-        
-        # Migrate weight_uom -> weight_unit_id
-        if distinct_weight_uoms:
-            logger.info(f"Migrating weight_uom field ({len(distinct_weight_uoms)} distinct values)...")
-            weight_uom_mapping = self.create_unit_mapping(distinct_weight_uoms)
-            
-            weight_unit_id_updated = 0
-            unmapped_weight_units = []
-            
-            for weight_uom_text, unit_id in weight_uom_mapping.items():
-                if unit_id is not None:
-                    update_query = text("""
-                        UPDATE style_variant_materials
-                        SET weight_unit_id = :unit_id
-                        WHERE weight_uom = :weight_uom_text
-                        AND weight_unit_id IS NULL
-                    """)
-                    
-                    result = self.db_samples.execute(
-                        update_query,
-                        {'unit_id': unit_id, 'weight_uom_text': weight_uom_text}
-                    )
-                    
-                    rows_updated = result.rowcount
-                    weight_unit_id_updated += rows_updated
-                    
-                    logger.info(f"  Updated {rows_updated} records: weight_uom '{weight_uom_text}' -> weight_unit_id={unit_id}")
-                else:
-                    unmapped_weight_units.append(weight_uom_text)
-                    
-                    # Get sample records
-                    sample_query = text("""
-                        SELECT id, style_variant_id, product_name, weight, weight_uom
-                        FROM style_variant_materials
-                        WHERE weight_uom = :weight_uom_text
-                        LIMIT 5
-                    """)
-                    
-                    sample_records = self.db_samples.execute(
-                        sample_query,
-                        {'weight_uom_text': weight_uom_text}
-                    ).fetchall()
-                    
-                    logger.warning(f"  Unmapped weight_uom: '{weight_uom_text}'")
-                    for record in sample_records:
-                        logger.warning(f"    - Record ID {record[0]}, Variant {record[1]}: {record[2]} - {record[3]} {record[4]}")
-            
-            self.stats['style_variant_materials']['weight_unit_id_updated'] = weight_unit_id_updated
-            self.stats['style_variant_materials']['weight_unit_id_unmapped'] = len(unmapped_weight_units)
-            self.stats['style_variant_materials']['unmapped_weight_units'] = unmapped_weight_units
+            for text_column, id_column, sample_columns, sample_format in columns:
+                mapping = mappings[text_column]
+                if not mapping:
+                    logger.info("No %s values to migrate in %s", text_column, table_name)
+                    stats.columns[id_column] = ColumnStats()
+                    continue
+                stats.columns[id_column] = self._migrate_column(
+                    db, table_name, text_column, id_column, sample_columns, sample_format, mapping
+                )
         
-        # Commit changes
-        self.db_samples.commit()
+        setattr(self.stats, table_name, stats)
         
-        logger.info(f"style_variant_materials migration complete:")
-        logger.info(f"  - unit_id: {self.stats['style_variant_materials']['unit_id_updated']} records updated")
-        logger.info(f"  - weight_unit_id: {self.stats['style_variant_materials']['weight_unit_id_updated']} records updated")
+        logger.info("%s migration complete (%d records):", table_name, stats.total)
+        for id_column, column_stats in stats.columns.items():
+            logger.info("  - %s: %d records updated", id_column, column_stats.updated)
+        return stats
     
     def verify_migration(self) -> bool:
         """
@@ -424,65 +587,36 @@ class UnitDataMigration:
         
         all_valid = True
         
-        # Check material_master
+        # All four checks in a single round trip
         null_count_query = text("""
-            SELECT COUNT(*)
-            FROM material_master
-            WHERE uom IS NOT NULL
-            AND unit_id IS NULL
+            SELECT 'mm', COUNT(*) FROM material_master
+            WHERE uom IS NOT NULL AND unit_id IS NULL
+            UNION ALL
+            SELECT 'srm', COUNT(*) FROM sample_required_materials
+            WHERE uom IS NOT NULL AND unit_id IS NULL
+            UNION ALL
+            SELECT 'svm', COUNT(*) FROM style_variant_materials
+            WHERE uom IS NOT NULL AND unit_id IS NULL
+            UNION ALL
+            SELECT 'svm_weight', COUNT(*) FROM style_variant_materials
+            WHERE weight_uom IS NOT NULL AND weight_unit_id IS NULL
         """)
-        null_count = self.db_samples.execute(null_count_query).scalar()
-        
-        if null_count > 0:
-            logger.error(f"material_master: {null_count} records still have NULL unit_id")
-            all_valid = False
-        else:
-            logger.info("material_master: All records have valid unit_id ✓")
         
-        # Check sample_required_materials
-        null_count_query = text("""
-            SELECT COUNT(*)
-            FROM sample_required_materials
-            WHERE uom IS NOT NULL
-            AND unit_id IS NULL
-        """)
-        null_count = self.db_samples.execute(null_count_query).scalar()
-        
-        if null_count > 0:
-            logger.error(f"sample_required_materials: {null_count} records still have NULL unit_id")
-            all_valid = False
-        else:
-            logger.info("sample_required_materials: All records have valid unit_id ✓")
-        
-        # Check style_variant_materials (unit_id)
-        null_count_query = text("""
-            SELECT COUNT(*)
-            FROM style_variant_materials
-            WHERE uom IS NOT NULL
-            AND unit_id IS NULL
-        """)
-        null_count = self.db_samples.execute(null_count_query).scalar()
-        
-        if null_count > 0:
-            logger.error(f"style_variant_materials: {null_count} records still have NULL unit_id")
-            all_valid = False
-        else:
-            logger.info("style_variant_materials: All records have valid unit_id ✓")
-        
-        # Check style_variant_materials (weight_unit_id)
-        null_count_query = text("""
-            SELECT COUNT(*)
-            FROM style_variant_materials
-            WHERE weight_uom IS NOT NULL
-            AND weight_unit_id IS NULL
-        """)
-        null_count = self.db_samples.execute(null_count_query).scalar()
+        # label -> (table, column) for log messages
+        checks = {
+            'mm': ('material_master', 'unit_id'),
+            'srm': ('sample_required_materials', 'unit_id'),
+            'svm': ('style_variant_materials', 'unit_id'),
+            'svm_weight': ('style_variant_materials', 'weight_unit_id'),
+        }
         
-        if null_count > 0:
-            logger.error(f"style_variant_materials: {null_count} records still have NULL weight_unit_id")
-            all_valid = False
-        else:
-            logger.info("style_variant_materials: All records have valid weight_unit_id ✓")
+        for label, null_count in self.db_samples.execute(null_count_query):
+            table_name, column_name = checks[label]
+            if null_count > 0:
+                logger.error(f"{table_name}: {null_count} records still have NULL {column_name}")
+                all_valid = False
+            else:
+                logger.info(f"{table_name}: All records have valid {column_name} ✓")
         
         return all_valid
     
@@ -494,50 +628,19 @@ class UnitDataMigration:
         logger.info("MIGRATION SUMMARY")
         logger.info("=" * 80)
         
-        # material_master
-        mm_stats = self.stats['material_master']
-        logger.info(f"\nmaterial_master:")
-        logger.info(f"  Total records: {mm_stats['total']}")
-        logger.info(f"  Updated: {mm_stats['updated']}")
-        logger.info(f"  Unmapped: {mm_stats['unmapped']}")
-        if mm_stats['unmapped_units']:
-            logger.info(f"  Unmapped units: {mm_stats['unmapped_units']}")
-        
-        # sample_required_materials
-        srm_stats = self.stats['sample_required_materials']
-        logger.info(f"\nsample_required_materials:")
-        logger.info(f"  Total records: {srm_stats['total']}")
-        logger.info(f"  Updated: {srm_stats['updated']}")
-        logger.info(f"  Unmapped: {srm_stats['unmapped']}")
-        if srm_stats['unmapped_units']:
-            logger.info(f"  Unmapped units: {srm_stats['unmapped_units']}")
-        
-        # style_variant_materials
-        svm_stats = self.stats['style_variant_materials']
-        logger.info(f"\nstyle_variant_materials:")
-        logger.info(f"  Total records: {svm_stats['total']}")
-        logger.info(f"  unit_id updated: {svm_stats['unit_id_updated']}")
-        logger.info(f"  weight_unit_id updated: {svm_stats['weight_unit_id_updated']}")
-        logger.info(f"  unit_id unmapped: {svm_stats['unit_id_unmapped']}")
-        logger.info(f"  weight_unit_id unmapped: {svm_stats['weight_unit_id_unmapped']}")
-        if svm_stats['unmapped_units']:
-            logger.info(f"  Unmapped units: {svm_stats['unmapped_units']}")
-        if svm_stats['unmapped_weight_units']:
-            logger.info(f"  Unmapped weight units: {svm_stats['unmapped_weight_units']}")
-        
-        # Total
-        total_updated = (
-            mm_stats['updated'] +
-            srm_stats['updated'] +
-            svm_stats['unit_id_updated'] +
-            svm_stats['weight_unit_id_updated']
-        )
-        total_unmapped = (
-            mm_stats['unmapped'] +
-            srm_stats['unmapped'] +
-            svm_stats['unit_id_unmapped'] +
-            svm_stats['weight_unit_id_unmapped']
-        )
+        total_updated = 0
+        total_unmapped = 0
+        for table_name in UNIT_MIGRATIONS:
+            table_stats = getattr(self.stats, table_name)
+            logger.info(f"\n{table_name}:")
+            logger.info(f"  Total records: {table_stats.total}")
+            for id_column, column_stats in table_stats.columns.items():
+                logger.info(f"  {id_column} updated: {column_stats.updated}")
+                logger.info(f"  {id_column} unmapped: {column_stats.unmapped}")
+                if column_stats.unmapped_units:
+                    logger.info(f"  {id_column} unmapped units: {column_stats.unmapped_units}")
+                total_updated += column_stats.updated
+                total_unmapped += column_stats.unmapped
         
         logger.info(f"\nTOTAL:")
         logger.info(f"  Records updated: {total_updated}")
@@ -545,6 +648,31 @@ class UnitDataMigration:
         
         logger.info("=" * 80)
     
+    def _migrate_table_in_worker(
+        self,
+        table_name: str,
+        mappings: Dict[str, Dict[str, Optional[int]]]
+    ) -> TableStats:
+        """
+        Run migrate_table() for one table on its own samples session.
+        
+        Used by run() to migrate the independent tables concurrently. The
+        mappings are already resolved, so the worker needs no units session
+        or mapping service.
+        
+        Args:
+            table_name: Key of UNIT_MIGRATIONS to migrate
+            mappings: Pre-resolved column name -> (unit text -> unit_id) for table_name
+        
+        Returns:
+            The TableStats for table_name
+        """
+        db = SessionLocalSamples()
+        try:
+            return self.migrate_table(db, table_name, mappings)
+        finally:
+            db.close()
+    
     def run(self) -> bool:
         """
         Run the complete migration process.
@@ -556,10 +684,27 @@ class UnitDataMigration:
             logger.info("Starting unit data migration...")
             logger.info(f"Timestamp: {datetime.now().isoformat()}")
             
-            # Migrate each table
-            self.migrate_material_master()
-            self.migrate_sample_required_materials()
-            self.migrate_style_variant_materials()
+            # Index the trimmed unit expressions used by every query below
+            self.ensure_unit_text_indexes()
+            
+            # Resolve the units of all tables with a single mapping-service call
+            unit_mappings = self.resolve_unit_mappings()
+            
+            # End the read transaction the DISTINCT scans opened: left idle, its
+            # ACCESS SHARE locks would block the workers' index/trigger DDL forever
+            self.db_samples.commit()
+            
+            # Migrate each table - they are disjoint, so run them concurrently
+            # on independent sessions and merge the statistics back here
+            with ThreadPoolExecutor(max_workers=len(UNIT_MIGRATIONS)) as executor:
+                futures = {
+                    table_name: executor.submit(
+                        self._migrate_table_in_worker, table_name, unit_mappings[table_name]
+                    )
+                    for table_name in UNIT_MIGRATIONS
+                }
+                for table_name, future in futures.items():
+                    setattr(self.stats, table_name, future.result())
             
             # Verify migration
             verification_passed = self.verify_migration()
@@ -579,18 +724,33 @@ class UnitDataMigration:
             logger.error(f"Migration failed with error: {e}", exc_info=True)
             self.db_samples.rollback()
             return False
+        finally:
+            # Do not leave the run's helper indexes behind on the tables
+            try:
+                self.drop_unit_text_indexes()
+            except Exception as e:
+                logger.warning(f"Could not drop the trimmed unit text indexes: {e}")
+                self.db_samples.rollback()
 
 
 def main():
     """
     Main entry point for the migration script.
     """
+    parser = argparse.ArgumentParser(description="Migrate plain text units to unit_id references")
+    parser.add_argument(
+        '--defer-index-maintenance',
+        action='store_true',
+        help="Drop unit id indexes and disable user triggers during the bulk UPDATEs, rebuild afterwards"
+    )
+    args = parser.parse_args()
+    
     logger.info("=" * 80)
     logger.info("UNIT DATA MIGRATION SCRIPT")
     logger.info("=" * 80)
     
     # Run migration
-    with UnitDataMigration() as migration:
+    with UnitDataMigration(defer_index_maintenance=args.defer_index_maintenance) as migration:
         success = migration.run()
     
     # Exit with appropriate code
@@ -0,0 +1,194 @@
+"""
+Shared helpers for the seed and import migrations
+- COPY FROM STDIN through a staging table, skipping existing rows
+- INSERT ... ON CONFLICT DO NOTHING (PostgreSQL and SQLite)
+- The migration_state key/value table (PostgreSQL and SQLite)
+- Deferring non-unique index maintenance during large loads
+"""
+
+import csv
+import io
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table, Text, func, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+
+def insert_ignore_existing(db: Session, model, rows: List[Dict], index_elements: List) -> int:
+    """
+    Insert rows in one statement, skipping any that conflict on index_elements.
+
+    Uses INSERT ... ON CONFLICT DO NOTHING on PostgreSQL and SQLite, built on
+    the model's Core table so no ORM state is involved.
+
+    Returns:
+        Number of rows actually inserted
+    """
+    insert = sqlite_insert if db.bind.dialect.name == "sqlite" else pg_insert
+    stmt = insert(model.__table__).values(rows).on_conflict_do_nothing(index_elements=index_elements)
+    return db.execute(stmt).rowcount
+
+
+migration_state = Table(
+    "migration_state",
+    MetaData(),
+    Column("key", String(100), primary_key=True),
+    Column("value", Text),
+    Column("updated_at", DateTime(timezone=True), server_default=func.current_timestamp()),
+)
+
+# Engines whose migration_state table is known to exist
+_migration_state_ready = set()
+
+
+def ensure_migration_state_table(engine: Engine):
+    """
+    Create the migration_state table once per engine.
+
+    The CREATE runs on its own connection and commits immediately, so a seed
+    transaction that later rolls back cannot take the table with it.
+    """
+    if engine not in _migration_state_ready:
+        migration_state.create(engine, checkfirst=True)
+        _migration_state_ready.add(engine)
+
+
+def get_migration_state(db: Session, key: str) -> Optional[str]:
+    """Read a value from the migration_state key/value table"""
+    ensure_migration_state_table(db.get_bind())
+    return db.execute(
+        select(migration_state.c.value).where(migration_state.c.key == key)
+    ).scalar()
+
+
+def set_migration_state(db: Session, key: str, value: str):
+    """Upsert a value into the migration_state key/value table"""
+    ensure_migration_state_table(db.get_bind())
+    db.execute(text("""
+        INSERT INTO migration_state (key, value, updated_at)
+        VALUES (:key, :value, CURRENT_TIMESTAMP)
+        ON CONFLICT (key)
+        DO UPDATE SET value = EXCLUDED.value, updated_at = CURRENT_TIMESTAMP
+    """), {"key": key, "value": value})
+
+
+@contextmanager
+def deferred_indexes(db: Session, table_name: str, enabled: bool = True):
+    """
+    Drop the non-unique indexes on table_name for the block and rebuild them after.
+
+    PostgreSQL only; a no-op elsewhere or when not enabled. table_name is resolved
+    through the search_path like any other reference, so only that table's indexes
+    are touched. Primary key and unique indexes stay in place for ON CONFLICT.
+    The block runs in a savepoint of the caller's transaction; if it fails, its
+    work is rolled back and the indexes are rebuilt before the error propagates.
+    """
+    if not enabled or db.bind.dialect.name != "postgresql":
+        yield
+        return
+
+    # The regclass text form is schema-qualified and quoted where needed
+    indexes = db.execute(text("""
+        SELECT CAST(CAST(x.indexrelid AS regclass) AS text), pg_get_indexdef(x.indexrelid)
+        FROM pg_index x
+        WHERE x.indrelid = CAST(:table_name AS regclass)
+        AND NOT x.indisprimary
+        AND NOT x.indisunique
+    """), {"table_name": table_name}).fetchall()
+
+    for index_name, _ in indexes:
+        db.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+
+    savepoint = db.begin_nested()
+    try:
+        yield
+    except Exception:
+        savepoint.rollback()
+        raise
+    else:
+        savepoint.commit()
+    finally:
+        # Built once over the loaded data instead of maintained row by row
+        for _, index_definition in indexes:
+            db.execute(text(index_definition))
+
+
+def copy_ignore_existing(
+    db: Session,
+    table_name: str,
+    fields: List[str],
+    rows: Iterable[Sequence],
+    conflict_column: str
+) -> int:
+    """
+    Bulk load rows with COPY FROM STDIN, skipping any whose conflict_column already exists (PostgreSQL only).
+
+    Rows are copied into a temporary staging table with the same column types and
+    moved over with INSERT ... ON CONFLICT DO NOTHING, so a concurrent or repeated
+    load is as safe as a plain ON CONFLICT insert.
+
+    Args:
+        table_name: Target table
+        fields: Target columns, in the order of each row
+        rows: Row values (None is written as NULL)
+        conflict_column: Unique column whose existing values are skipped
+
+    Returns:
+        Number of rows actually inserted
+    """
+    column_list = ', '.join(fields)
+    staging_table = f"{table_name}_staging"
+
+    # Same column types as the target, but none of its constraints or defaults
+    db.execute(text(f"""
+        CREATE TEMP TABLE {staging_table} ON COMMIT DROP AS
+        SELECT {column_list} FROM {table_name} WITH NO DATA
+    """))
+
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+
+    # Use the session's own DBAPI connection so the COPY joins the open transaction
+    raw_connection = db.connection().connection
+    cursor = raw_connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY {staging_table} ({column_list}) FROM STDIN WITH (FORMAT csv)", buffer)
+    finally:
+        cursor.close()
+
+    result = db.execute(text(f"""
+        INSERT INTO {table_name} ({column_list})
+        SELECT {column_list} FROM {staging_table}
+        ON CONFLICT ({conflict_column}) DO NOTHING
+    """))
+    db.execute(text(f"DROP TABLE {staging_table}"))
+    return result.rowcount
+
+
+def copy_universal_colors(db: Session, colors: List[Dict]) -> int:
+    """
+    Bulk load universal colors with COPY, skipping existing color codes (PostgreSQL only).
+
+    Returns:
+        Number of colors actually inserted
+    """
+    # COPY bypasses the model's Python-side defaults, so missing ones are written explicitly
+    now = datetime.now(timezone.utc)
+    defaults = {"is_active": True, "created_at": now, "updated_at": now}
+    fields = list(colors[0].keys())
+    default_fields = [field for field in defaults if field not in fields]
+
+    rows = (
+        # Enum columns are stored by member name
+        [value.name if isinstance(value, Enum) else value for value in color.values()]
+        + [defaults[field] for field in default_fields]
+        for color in colors
+    )
+    return copy_ignore_existing(db, "universal_colors", fields + default_fields, rows, "color_code")
@@ -0,0 +1,134 @@
+"""
+Integration tests for the unit data migration
+
+Runs UnitDataMigration.run() end to end against the samples database
+(DATABASE_URL_SAMPLES) using the test materials from test_migration_with_data.
+Skipped when the database is not reachable.
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from core.database import SessionLocalSamples
+from migrations.migrate_unit_data import UNIT_TEXT_COLUMNS, UnitDataMigration
+from migrations.test_migration_with_data import (
+    cleanup_test_data,
+    create_test_data,
+    verify_migration as verify_test_materials,
+)
+
+# A lock wait between the main session and the table workers never ends on
+# its own, so run() is given a deadline instead of blocking the suite
+RUN_TIMEOUT_SECONDS = 120
+
+
+def run_with_timeout(migration: UnitDataMigration):
+    """Run migration.run() in a thread; returns (finished, result)"""
+    outcome = {}
+    worker = threading.Thread(target=lambda: outcome.update(result=migration.run()), daemon=True)
+    worker.start()
+    worker.join(RUN_TIMEOUT_SECONDS)
+    return not worker.is_alive(), outcome.get("result")
+
+
+@pytest.fixture
+def samples_db():
+    """Skip unless the samples database is reachable"""
+    db = SessionLocalSamples()
+    try:
+        db.execute(text("SELECT 1"))
+    except OperationalError:
+        pytest.skip("Integration test - requires the samples database")
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def test_materials(samples_db):
+    """Insert the test materials and remove them afterwards"""
+    create_test_data()
+    yield
+    cleanup_test_data()
+
+
+@pytest.fixture
+def padded_materials(test_materials):
+    """Test materials whose uom differs from another test material's only by whitespace"""
+    db = SessionLocalSamples()
+    try:
+        db.execute(text("""
+            INSERT INTO material_master (material_name, uom, material_category)
+            VALUES ('Padded Polyester Yarn', '  kg ', 'Test'), ('Padded Cotton Fabric', 'meter ', 'Test')
+            ON CONFLICT (material_name) DO NOTHING
+        """))
+        db.commit()
+    finally:
+        db.close()
+
+
+def fetch_unit_ids(names):
+    """material_name -> unit_id for the given test materials"""
+    db = SessionLocalSamples()
+    try:
+        return dict(db.execute(text("""
+            SELECT material_name, unit_id FROM material_master
+            WHERE material_category = 'Test' AND material_name = ANY(:names)
+        """), {"names": list(names)}).all())
+    finally:
+        db.close()
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("defer_index_maintenance", [False, True])
+def test_run_completes_end_to_end(test_materials, defer_index_maintenance):
+    """run() finishes (no lock wait on the main session) and maps the test materials"""
+    with UnitDataMigration(defer_index_maintenance=defer_index_maintenance) as migration:
+        finished, _ = run_with_timeout(migration)
+
+        assert finished, f"run() did not finish within {RUN_TIMEOUT_SECONDS}s (lock wait?)"
+        assert migration.stats.material_master.total > 0
+
+    # success also reflects unrelated rows with unmapped units, so check the
+    # test materials themselves
+    assert verify_test_materials()
+
+
+@pytest.mark.integration
+def test_whitespace_padded_units_map_like_their_trimmed_text(padded_materials):
+    """Units are matched on NULLIF(TRIM(uom), ''), so padded values get the trimmed value's unit_id"""
+    with UnitDataMigration() as migration:
+        finished, _ = run_with_timeout(migration)
+    assert finished, f"run() did not finish within {RUN_TIMEOUT_SECONDS}s (lock wait?)"
+
+    unit_ids = fetch_unit_ids(["Polyester Yarn", "Padded Polyester Yarn", "Cotton Fabric", "Padded Cotton Fabric"])
+    assert unit_ids["Padded Polyester Yarn"] is not None
+    assert unit_ids["Padded Polyester Yarn"] == unit_ids["Polyester Yarn"]
+    assert unit_ids["Padded Cotton Fabric"] == unit_ids["Cotton Fabric"]
+
+
+@pytest.mark.integration
+def test_run_leaves_no_trimmed_text_indexes(test_materials):
+    """The functional indexes only exist for the duration of run()"""
+    with UnitDataMigration() as migration:
+        finished, _ = run_with_timeout(migration)
+    assert finished, f"run() did not finish within {RUN_TIMEOUT_SECONDS}s (lock wait?)"
+
+    db = SessionLocalSamples()
+    try:
+        leftover = [
+            index_name
+            for index_name in (f"ix_{table_name}_{column_name}_trimmed" for table_name, column_name in UNIT_TEXT_COLUMNS)
+            if db.execute(text("SELECT to_regclass(:index_name)"), {"index_name": index_name}).scalar() is not None
+        ]
+    finally:
+        db.close()
+    assert leftover == []
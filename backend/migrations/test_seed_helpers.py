@@ -0,0 +1,177 @@
+"""
+Tests for the shared seed helpers
+
+The INSERT ... ON CONFLICT and migration_state tests run on a temporary
+SQLite database. The COPY and index tests need PostgreSQL and run against
+the size/color database (DATABASE_URL_SIZECOLOR) on temporary tables;
+they are skipped when the database is not reachable.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, event, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, declarative_base
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from core.database import SessionLocalSizeColor
+from migrations.seed_helpers import (
+    copy_ignore_existing,
+    deferred_indexes,
+    get_migration_state,
+    insert_ignore_existing,
+    set_migration_state,
+)
+
+Base = declarative_base()
+
+
+class SeedItem(Base):
+    """Minimal seeded table with a unique code"""
+    __tablename__ = "seed_items"
+
+    id = Column(Integer, primary_key=True)
+    code = Column(String(20), unique=True, nullable=False)
+    name = Column(String(50))
+
+
+@pytest.fixture
+def sqlite_db(tmp_path):
+    """Session on a fresh SQLite database file"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'seed_helpers.db'}")
+    Base.metadata.create_all(engine)
+    db = Session(engine)
+    yield db
+    db.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def postgres_db():
+    """Size/color session with a temporary seed_helper_items table; rolled back afterwards"""
+    db = SessionLocalSizeColor()
+    try:
+        db.execute(text("SELECT 1"))
+    except OperationalError:
+        db.close()
+        pytest.skip("Integration test - requires the size/color database")
+    if db.bind.dialect.name != "postgresql":
+        db.close()
+        pytest.skip("COPY and index tests require PostgreSQL")
+
+    db.execute(text("""
+        CREATE TEMP TABLE seed_helper_items (
+            id SERIAL PRIMARY KEY,
+            code VARCHAR(20) UNIQUE NOT NULL,
+            name VARCHAR(50)
+        ) ON COMMIT DROP
+    """))
+    db.execute(text("CREATE INDEX ix_seed_helper_items_name ON seed_helper_items (name)"))
+    yield db
+    db.rollback()
+    db.close()
+
+
+def index_names(db: Session):
+    """Names of the indexes currently on seed_helper_items"""
+    return set(db.execute(text("""
+        SELECT i.relname
+        FROM pg_index x
+        JOIN pg_class i ON i.oid = x.indexrelid
+        WHERE x.indrelid = CAST('seed_helper_items' AS regclass)
+    """)).scalars())
+
+
+class TestInsertIgnoreExisting:
+    """insert_ignore_existing skips conflicting rows instead of failing"""
+
+    def test_skips_rows_that_already_exist(self, sqlite_db):
+        insert_ignore_existing(sqlite_db, SeedItem, [{"code": "A", "name": "first"}], ["code"])
+
+        inserted = insert_ignore_existing(
+            sqlite_db, SeedItem, [{"code": "A", "name": "second"}, {"code": "B", "name": "new"}], ["code"]
+        )
+
+        assert inserted == 1
+        assert dict(sqlite_db.execute(select(SeedItem.code, SeedItem.name)).all()) == {"A": "first", "B": "new"}
+
+
+class TestMigrationState:
+    """migration_state round-trips values and is created only once"""
+
+    def test_round_trip(self, sqlite_db):
+        assert get_migration_state(sqlite_db, "seed_version") is None
+
+        set_migration_state(sqlite_db, "seed_version", "1")
+        assert get_migration_state(sqlite_db, "seed_version") == "1"
+
+        set_migration_state(sqlite_db, "seed_version", "2")
+        assert get_migration_state(sqlite_db, "seed_version") == "2"
+
+    def test_table_is_created_once(self, sqlite_db):
+        statements = []
+        event.listen(
+            sqlite_db.get_bind(), "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement)
+        )
+
+        get_migration_state(sqlite_db, "seed_version")
+        set_migration_state(sqlite_db, "seed_version", "1")
+        get_migration_state(sqlite_db, "seed_version")
+
+        assert sum("CREATE TABLE migration_state" in statement for statement in statements) == 1
+
+    def test_table_survives_rollback(self, sqlite_db):
+        get_migration_state(sqlite_db, "seed_version")
+        set_migration_state(sqlite_db, "seed_version", "1")
+        sqlite_db.rollback()
+
+        assert get_migration_state(sqlite_db, "seed_version") is None
+
+
+@pytest.mark.integration
+class TestCopyIgnoreExisting:
+    """copy_ignore_existing loads through a staging table and skips existing keys"""
+
+    def test_skips_rows_that_already_exist(self, postgres_db):
+        postgres_db.execute(text("INSERT INTO seed_helper_items (code, name) VALUES ('A', 'first')"))
+
+        inserted = copy_ignore_existing(
+            postgres_db, "seed_helper_items", ["code", "name"], [("A", "second"), ("B", "new")], "code"
+        )
+
+        assert inserted == 1
+        rows = postgres_db.execute(text("SELECT code, name FROM seed_helper_items")).all()
+        assert dict(rows) == {"A": "first", "B": "new"}
+
+
+@pytest.mark.integration
+class TestDeferredIndexes:
+    """deferred_indexes drops only non-unique indexes and always rebuilds them"""
+
+    def test_drops_non_unique_indexes_for_the_block(self, postgres_db):
+        before = index_names(postgres_db)
+
+        with deferred_indexes(postgres_db, "seed_helper_items"):
+            during = index_names(postgres_db)
+
+        assert "ix_seed_helper_items_name" not in during
+        assert during == before - {"ix_seed_helper_items_name"}
+        assert index_names(postgres_db) == before
+
+    def test_restores_indexes_after_an_exception(self, postgres_db):
+        before = index_names(postgres_db)
+
+        with pytest.raises(RuntimeError):
+            with deferred_indexes(postgres_db, "seed_helper_items"):
+                postgres_db.execute(text("INSERT INTO seed_helper_items (code, name) VALUES ('A', 'lost')"))
+                raise RuntimeError("load failed")
+
+        # Indexes are back and the block's work is undone, with the transaction still usable
+        assert index_names(postgres_db) == before
+        assert postgres_db.execute(text("SELECT COUNT(*) FROM seed_helper_items")).scalar() == 0